@@ -8,6 +8,30 @@ from datetime import datetime
 from langchain_openai import ChatOpenAI
 
 
+# Prefix of the result string returned when a browser task fails
+TASK_ERROR_PREFIX = "Error executing task"
+
+# Static part of the per-task browser instructions, built once at import
+TASK_GUIDELINES = """
+            Remember to:
+            1. Click the correct tab first
+            2. Fill in all required fields
+            3. Click the process button
+            4. Read and return the result message
+            
+            The interface is built with Gradio, so look for:
+            - Tab elements with text like 'Cancel Order', 'Price Match', or 'Refund'
+            - Text inputs with labels like 'Order ID', 'Customer Name'
+            - Number inputs for amounts
+            - Buttons with text like 'Process Refund', 'Cancel Order', etc.
+            - Result messages in HTML format
+            
+            Take your time with each step and make sure to:
+            - Wait for elements to be visible before interacting
+            - Verify the correct tab is selected
+            - Double-check input values before submitting
+            - Wait for results to appear before proceeding
+            """
 
 
 class AIAgent:
@@ -69,26 +93,7 @@ class AIAgent:
         try:
             # Update the agent's task with the specific customer request
             task_instructions = f"""Navigate to {self.server_url} and handle this customer request: {task.description}
-            
-            Remember to:
-            1. Click the correct tab first
-            2. Fill in all required fields
-            3. Click the process button
-            4. Read and return the result message
-            
-            The interface is built with Gradio, so look for:
-            - Tab elements with text like 'Cancel Order', 'Price Match', or 'Refund'
-            - Text inputs with labels like 'Order ID', 'Customer Name'
-            - Number inputs for amounts
-            - Buttons with text like 'Process Refund', 'Cancel Order', etc.
-            - Result messages in HTML format
-            
-            Take your time with each step and make sure to:
-            - Wait for elements to be visible before interacting
-            - Verify the correct tab is selected
-            - Double-check input values before submitting
-            - Wait for results to appear before proceeding
-            """
+            {TASK_GUIDELINES}"""
             
             print("Starting browser automation...")
             self.agent.task = task_instructions
@@ -128,7 +133,7 @@ class AIAgent:
                 
         except Exception as e:
             print(f"❌ Error executing task: {str(e)}")
-            return f"Error executing task: {str(e)}"
+            return f"{TASK_ERROR_PREFIX}: {str(e)}"
     
     async def cleanup(self):
         """Cleanup resources"""
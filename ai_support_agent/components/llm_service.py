@@ -1,10 +1,21 @@
 import openai
 from openai import AsyncOpenAI
+from functools import lru_cache
 from typing import List
 import json
 from config import Config
-from utils.models import TranscriptEntry, Task
-import uuid
+from utils.models import TranscriptEntry, Task, DEFAULT_OPERATOR_INSTRUCTIONS
+
+# Description of the placeholder task returned when the LLM step fails
+FALLBACK_DESCRIPTION = "Unable to process conversation - manual review needed"
+
+# Instructions for folding archived turns into the running call summary
+SUMMARY_PROMPT = (
+    "You maintain a running summary of a customer support call. Update the "
+    "summary so far with the new messages. Keep customer names, order "
+    "numbers, amounts, requests and anything already agreed. Reply with the "
+    "updated summary only, in under 150 words."
+)
 
 class LLMService:
     def __init__(self):
@@ -63,7 +74,7 @@ class LLMService:
         - Have confidence in how to respond to the customer
         """
 
-    async def generate_task_from_transcript(self, transcript: List[TranscriptEntry]) -> Task:
+    async def generate_task_from_transcript(self, transcript: List[TranscriptEntry], committed_prefix: str = "") -> Task:
         """Generate task/plan from conversation transcript with layman-friendly analysis"""
         print("\n=== LLM Service: generate_task_from_transcript ===")
         
@@ -72,7 +83,7 @@ class LLMService:
             return self._fallback_task()
         
         # Convert transcript to plain text for LLM
-        conversation_text = self._format_transcript_for_llm(transcript)
+        conversation_text = self._format_transcript_for_llm(transcript, committed_prefix)
         print(f"Formatted conversation for LLM:\n{conversation_text}")
         
         try:
@@ -82,7 +93,6 @@ class LLMService:
             
             # Create task from LLM response with enhanced information
             task = Task(
-                id=str(uuid.uuid4()),
                 customer_name=response.get("customer_name", "Customer"),
                 order_number=response.get("order_number"),
                 order_status=response.get("order_status"),
@@ -97,8 +107,8 @@ class LLMService:
             # Store additional layman-friendly information
             task.issue_category = response.get("issue_category", "General Inquiry")
             task.urgency_level = response.get("urgency_level", "Medium")
-            task.operator_instructions = response.get("operator_instructions", "Review customer request and provide assistance")
-            task.verification_points = response.get("verification_points", [])
+            task.operator_instructions = response.get("operator_instructions", DEFAULT_OPERATOR_INSTRUCTIONS)
+            task.verification_points = tuple(response.get("verification_points", ()))
             task.suggested_response = response.get("suggested_response", "Thank you for contacting us. Let me help you with that.")
 
             print(f"[LLMService] Generated task:")
@@ -115,6 +125,28 @@ class LLMService:
             traceback.print_exc()
             return self._fallback_task()
 
+    async def summarize_turns(self, summary: str, entries: List[TranscriptEntry]) -> str:
+        """Fold newly archived turns into the running summary of the call"""
+        lines = []
+        if summary:
+            lines.append("SUMMARY SO FAR:")
+            lines.append(summary)
+            lines.append("")
+        lines.append("NEW MESSAGES:")
+        for entry in entries:
+            lines.append(f"{entry.speaker}: {entry.text}")
+
+        response = await self.client.chat.completions.create(
+            model=Config.LLM_MODEL,
+            messages=[
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {"role": "user", "content": "\n".join(lines)}
+            ],
+            temperature=0.1,
+            max_tokens=400
+        )
+        return response.choices[0].message.content.strip()
+
     def _create_operator_plan(self, response: dict) -> List[str]:
         """Create a clear action plan for the operator"""
         base_instructions = response.get("operator_instructions", "")
@@ -151,18 +183,22 @@ class LLMService:
         
         return plan if plan else ["Review customer request and provide appropriate assistance"]
 
-    def _format_transcript_for_llm(self, transcript: List[TranscriptEntry]) -> str:
+    def _format_transcript_for_llm(self, transcript: List[TranscriptEntry], committed_prefix: str = "") -> str:
         """Format transcript entries for LLM processing"""
         if not transcript:
             return "No conversation available."
         
         lines = []
+        # Summary of archived turns goes first so the prompt prefix stays stable
+        if committed_prefix:
+            lines.append(committed_prefix)
+            lines.append("")
         lines.append("CUSTOMER SERVICE CONVERSATION:")
         lines.append("=" * 40)
         
-        for i, entry in enumerate(transcript, 1):
-            timestamp_str = entry.timestamp.strftime("%H:%M:%S")
-            lines.append(f"[{timestamp_str}] {entry.text}")
+        for entry in transcript:
+            ts = entry.timestamp
+            lines.append(f"[{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}] {entry.text}")
         
         lines.append("=" * 40)
         lines.append("")
@@ -221,10 +257,9 @@ class LLMService:
     def _fallback_task(self) -> Task:
         """Fallback task when LLM processing fails"""
         task = Task(
-            id=str(uuid.uuid4()),
             customer_name="Customer",
-            description="Unable to process conversation - manual review needed",
-            issue_description="Unable to process conversation - manual review needed",
+            description=FALLBACK_DESCRIPTION,
+            issue_description=FALLBACK_DESCRIPTION,
             generated_plan=[
                 "🔍 VERIFY WITH CUSTOMER:",
                 "   • Confirm their main concern",
@@ -244,7 +279,13 @@ class LLMService:
         task.issue_category = "General Inquiry"
         task.urgency_level = "Medium"
         task.operator_instructions = "Manual review required - system could not analyze conversation"
-        task.verification_points = ["Confirm customer's main concern"]
+        task.verification_points = ("Confirm customer's main concern",)
         task.suggested_response = "Thank you for contacting us. Let me review your request and provide you with the best assistance possible."
         
-        return task
\ No newline at end of file
+        return task
+
+
+@lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    """Shared LLMService so the client and system prompt are only set up once"""
+    return LLMService()
@@ -1,3 +1,4 @@
+from typing import Optional
 from utils.models import Task
 from .rag_service import RAGService
 from .ai_agent import AIAgent
@@ -10,7 +11,7 @@ class Orchestrator:
         self.state_manager = state_manager
         self.llm_service = None  # Can add LLM-based routing logic later
     
-    async def route_task(self, task: Task) -> str:
+    async def route_task(self, task: Task, rag_hint: Optional[str] = None) -> str:
         """Route task to appropriate service based on task type"""
         
     
@@ -23,7 +24,7 @@ class Orchestrator:
 
         try:
             if task.task_type == "rag":
-                result = await self.rag_service.search(task.description)
+                result = await self.rag_service.search(task.description, context=rag_hint)
             elif task.task_type == "agent":
                 result = await self.ai_agent.execute_task(task)
             else:
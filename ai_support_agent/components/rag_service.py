@@ -1,14 +1,15 @@
 import json
 import aiofiles
-from typing import Dict, List
+from typing import Dict, List, Optional
 from config import Config
-from components.llm_service import LLMService
+from components.llm_service import get_llm_service
 
 class RAGService:
     def __init__(self):
         self.knowledge_base = {}
         self.policies = ""
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
+        self._context = None  # Flattened knowledge base + policies
     
     async def initialize(self):
         """Load knowledge base and policies"""
@@ -37,19 +38,32 @@ class RAGService:
                 "shipping_info": "Standard shipping: 5-7 days, Express: 2-3 days"
             }
             self.policies = "Company policies: Customer satisfaction is our priority."
+        self._context = None
     
-    async def search(self, query: str) -> str:
-        """Context-based LLM response using all knowledge base and policies as context."""
-        # Flatten knowledge base and policies into a context string
-        context = "Knowledge Base and Policies:\n"
+    def _build_context(self) -> str:
+        """Flatten knowledge base and policies into a context string"""
+        lines = ["Knowledge Base and Policies:"]
         for key, value in self.knowledge_base.items():
             if isinstance(value, dict):
-                context += f"{key}:\n"
-                for subkey, subval in value.items():
-                    context += f"  {subkey}: {subval}\n"
+                lines.append(f"{key}:")
+                lines.extend(f"  {subkey}: {subval}" for subkey, subval in value.items())
             else:
-                context += f"{key}: {value}\n"
-        context += f"\nPolicies:\n{self.policies}\n"
+                lines.append(f"{key}: {value}")
+        lines.append("")
+        lines.append("Policies:")
+        lines.append(self.policies)
+        return "\n".join(lines) + "\n"
+
+    def prefetch(self) -> str:
+        """Retrieval context, built once and cached (it doesn't depend on the query)"""
+        if self._context is None:
+            self._context = self._build_context()
+        return self._context
+
+    async def search(self, query: str, context: Optional[str] = None) -> str:
+        """Context-based LLM response using all knowledge base and policies as context."""
+        if context is None:
+            context = self.prefetch()
         prompt = f"""
 You are a helpful assistant. Use the following context to answer the user's question.
 
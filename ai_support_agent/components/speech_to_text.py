@@ -111,7 +111,10 @@ class SpeechToTextService:
             return
 
         try:
-            self.transcriber.stream(self.microphone_stream)
+            # stream() blocks until the microphone closes, so keep it off the loop
+            await asyncio.to_thread(
+                self.transcriber.stream, self.microphone_stream
+            )
         except Exception as e:
             print(f"Audio streaming error: {e}")
             self.stop_transcription()
@@ -139,11 +142,11 @@ class SpeechToTextService:
         if isinstance(transcript, aai.RealtimeFinalTranscript):
             # Treat all speech as from a single speaker (could be customer or agent)
             # The LLM will figure out who is speaking based on context
-            speaker = "speaker"  # Generic speaker label
+            speaker = Speaker.SPEAKER  # Generic speaker label
 
-            # Create the transcript entry
-            entry = TranscriptEntry(
-                speaker=Speaker(speaker),
+            # Create the transcript entry (values are already typed)
+            entry = TranscriptEntry.unsafe_new(
+                speaker=speaker,
                 text=transcript.text,
                 timestamp=datetime.now(),
             )
@@ -1,40 +1,164 @@
 import asyncio
-from typing import Optional, List, Callable
-from utils.models import AppState, TranscriptEntry, Task
-import uuid
+import gzip
+import os
+import pickle
+from typing import Awaitable, Optional, List, Callable, NamedTuple, Tuple
+from config import Config
+from utils.models import AppState, TranscriptEntry, Task, generate_id
 import threading
 
 
+class StateView(NamedTuple):
+    """Read-only view of the current state (transcript is append-only)"""
+
+    conversation_id: str
+    transcript: Tuple[TranscriptEntry, ...]
+    current_task: Optional[Task]
+    version: int
+
+
 class StateManager:
     def __init__(self, transcript_storage=None):
-        self.state = AppState(conversation_id=str(uuid.uuid4()))
+        self.state = AppState(conversation_id=generate_id())
         self._listeners: List[Callable] = []
         self._lock = threading.RLock()
         self.transcript_storage = transcript_storage
         self._auto_save_threshold = 5  # Auto-save every 5 entries
+        self._window_size = Config.TRANSCRIPT_WINDOW_SIZE
+        self._evict_slack = Config.TRANSCRIPT_EVICT_SLACK
+        self._archive_dir = Config.TRANSCRIPT_ARCHIVE_DIR
+        self._archived_count = 0
+        self._archive_summary = ""  # Running summary of summarized archived turns
+        self._unsummarized: List[TranscriptEntry] = []  # Archived, not yet summarized
+        self._committed_prefix: Optional[str] = None
+        self._version = 0  # Bumped on every transcript change
+        self._transcript_view: Tuple[TranscriptEntry, ...] = ()
+        self._transcript_view_version = 0
+
+    def append_transcript_entry(self, entry: TranscriptEntry):
+        """Thread-safe synchronous append, used from the STT callback thread"""
+        with self._lock:
+            self.state.add_transcript_entry(entry)
+            self._version += 1
+            # Evict in blocks so the archive write and the committed prefix
+            # change once per slack entries, not on every turn
+            if len(self.state.transcript) > self._window_size:
+                self._evict_overflow()
 
     async def add_transcript_entry(self, entry: TranscriptEntry):
         with self._lock:
             print(
                 f"\nAdding transcript entry: {entry.speaker.value}: {entry.text}"
             )
-            self.state.transcript.append(entry)
+            self.append_transcript_entry(entry)
 
-            # Auto-save transcript periodically
+            # Auto-save transcript periodically (counted over the whole
+            # conversation, since the in-memory window is capped)
             if (
                 self.transcript_storage
-                and len(self.state.transcript) % self._auto_save_threshold == 0
+                and self._total_entries() % self._auto_save_threshold == 0
             ):
                 asyncio.create_task(self._auto_save_transcript())
 
             self._notify_listeners_sync()
 
+    def _total_entries(self) -> int:
+        """Entries in the conversation, including those archived"""
+        return self._archived_count + len(self.state.transcript)
+
+    def _get_archive_path(self) -> str:
+        """Archive file for turns evicted from the in-memory window"""
+        return os.path.join(
+            self._archive_dir,
+            f"archive_{self.state.conversation_id}.pkl.gz",
+        )
+
+    def _evict_overflow(self):
+        """Spill the oldest block of entries to compressed storage"""
+        overflow = len(self.state.transcript) - (
+            self._window_size - self._evict_slack
+        )
+        evicted = self.state.evict_old(overflow)
+
+        try:
+            os.makedirs(self._archive_dir, exist_ok=True)
+            # Each eviction appends a new gzip member; load_archived_transcript
+            # reads them back in order
+            with gzip.open(self._get_archive_path(), "ab") as f:
+                pickle.dump(evicted, f)
+        except Exception as e:
+            print(f"Error archiving transcript entries: {e}")
+
+        self._archived_count += len(evicted)
+        self._unsummarized.extend(evicted)
+        self._committed_prefix = None  # Rebuilt lazily on next read
+
+    def load_archived_transcript(self) -> List[TranscriptEntry]:
+        """Re-hydrate entries evicted from the in-memory window"""
+        with self._lock:
+            path = self._get_archive_path()
+            entries: List[TranscriptEntry] = []
+            if not os.path.exists(path):
+                return entries
+
+            with gzip.open(path, "rb") as f:
+                while True:
+                    try:
+                        entries.extend(pickle.load(f))
+                    except EOFError:
+                        break
+            return entries
+
+    def get_full_transcript(self) -> List[TranscriptEntry]:
+        """Archived entries followed by the in-memory window"""
+        with self._lock:
+            return self.load_archived_transcript() + list(self.state.transcript)
+
+    async def get_committed_prefix(
+        self,
+        summarize: Callable[[str, List[TranscriptEntry]], Awaitable[str]],
+    ) -> str:
+        """Summary of archived turns, rebuilt once per eviction block and cached"""
+        with self._lock:
+            if self._committed_prefix is not None:
+                return self._committed_prefix
+            conversation_id = self.state.conversation_id
+            summary = self._archive_summary
+            pending = list(self._unsummarized)
+
+        if pending:
+            # Fold the newly archived block into the running summary; the
+            # LLM call runs outside the lock so appends aren't held up
+            try:
+                summary = await summarize(summary, pending)
+            except Exception as e:
+                # Not cached, so the next trigger retries the block
+                print(f"Error summarizing archived transcript: {e}")
+                return self._format_committed_prefix(summary)
+
+        with self._lock:
+            if self.state.conversation_id != conversation_id:
+                return ""  # Cleared while summarizing
+            # Blocks evicted during the await stay queued for the next read
+            del self._unsummarized[: len(pending)]
+            self._archive_summary = summary
+            prefix = self._format_committed_prefix(summary)
+            if not self._unsummarized:
+                self._committed_prefix = prefix
+            return prefix
+
+    def _format_committed_prefix(self, summary: str) -> str:
+        """Prompt section carrying the summary of archived turns"""
+        if not summary:
+            return ""
+        return f"EARLIER IN THIS CALL (summary of archived messages):\n{summary}"
+
     async def _auto_save_transcript(self):
         """Auto-save transcript in background"""
         try:
             if self.transcript_storage:
-                filename = await self.transcript_storage.auto_save_transcript(
-                    self.state
+                filename = await self.transcript_storage.save_transcript(
+                    self.state.conversation_id, self.get_full_transcript()
                 )
                 if filename:
                     print(f"Auto-saved transcript to: {filename}")
@@ -49,7 +173,7 @@ class StateManager:
 
         try:
             filename = await self.transcript_storage.save_transcript(
-                self.state.conversation_id, self.state.transcript
+                self.state.conversation_id, self.get_full_transcript()
             )
             print(f"Transcript manually saved to: {filename}")
             return filename
@@ -92,10 +216,28 @@ class StateManager:
         with self._lock:
             return self.state.model_copy()
 
+    def snapshot_view(self) -> StateView:
+        """Cheap read-only snapshot; the transcript tuple is rebuilt only on change"""
+        with self._lock:
+            if self._transcript_view_version != self._version:
+                self._transcript_view = tuple(self.state.transcript)
+                self._transcript_view_version = self._version
+            return StateView(
+                conversation_id=self.state.conversation_id,
+                transcript=self._transcript_view,
+                current_task=self.state.current_task,
+                version=self._version,
+            )
+
     def clear_transcript(self):
         """Clear current transcript and start new conversation"""
         with self._lock:
-            self.state.transcript.clear()
-            self.state.conversation_id = str(uuid.uuid4())
+            self.state.clear_transcript()
+            self.state.conversation_id = generate_id()
+            self._version += 1
+            self._archived_count = 0
+            self._archive_summary = ""
+            self._unsummarized = []
+            self._committed_prefix = None
             print(f"Started new conversation: {self.state.conversation_id}")
             self._notify_listeners_sync()
@@ -42,7 +42,7 @@ class TranscriptStorageService:
         for entry in transcript:
             timestamp_str = entry.timestamp.strftime("%H:%M:%S")
             lines.append(
-                f"[{timestamp_str}] {entry.speaker.value}: {entry.text}"
+                f"[{timestamp_str}] {entry.speaker}: {entry.text}"
             )
 
         lines.append("")
@@ -82,7 +82,7 @@ class TranscriptStorageService:
 
         for entry in transcript:
             # Simple format for LLM - just speaker and text
-            lines.append(f"{entry.speaker.value}: {entry.text}")
+            lines.append(f"{entry.speaker}: {entry.text}")
 
         return "\n".join(lines)
 
@@ -22,6 +22,11 @@ class Config:
     POLICIES_PATH = "data/policies.txt"
     GRADIO_PORT = 7860
 
+    # Transcript Configuration
+    TRANSCRIPT_WINDOW_SIZE = 200  # Max entries kept in memory / sent to the LLM
+    TRANSCRIPT_EVICT_SLACK = 50  # Entries evicted as one block when the window fills
+    TRANSCRIPT_ARCHIVE_DIR = "data/transcripts"
+
     # Server Configuration
     SERVER_HOST = "localhost"
     SERVER_PORT = 7866
@@ -4,9 +4,15 @@ from components.state_manager import StateManager
 from utils.models import AppState, Speaker
 import asyncio
 import threading
+import time
 
 
 class GradioInterface:
+    # UI refresh intervals (seconds): fast right after a trigger, slow otherwise
+    REFRESH_IDLE = 2.0
+    REFRESH_ACTIVE = 0.15
+    ACTIVE_WINDOW = 30.0
+
     def __init__(self, state_manager: StateManager):
         self.state_manager = state_manager
         self.interface = None
@@ -15,6 +21,8 @@ class GradioInterface:
         self.status_display = None
         self.result_display = None
         self.state_component = None
+        self.refresh_timer = None
+        self.refresh_deadline = None
 
     def create_interface(self, trigger_callback: Optional[Callable] = None):
         """Create Gradio interface"""
@@ -89,8 +97,18 @@ class GradioInterface:
                 value={"conversation": [], "status": "Ready"}
             )
 
-            # Set up event handlers
+            # Single timer driving the conversation refresh, plus the
+            # per-session deadline for its fast mode
+            self.refresh_timer = gr.Timer(self.REFRESH_IDLE)
+            self.refresh_deadline = gr.State(value=0.0)
+
+            # Set up event handlers: speed up the refresh at click time,
+            # then run the (slow) trigger
             trigger_btn.click(
+                fn=self.start_fast_refresh,
+                outputs=[self.refresh_deadline, self.refresh_timer],
+                queue=False,
+            ).then(
                 fn=self.handle_trigger,
                 inputs=[self.state_component],
                 outputs=[
@@ -114,22 +132,40 @@ class GradioInterface:
             save_btn.click(fn=self.handle_save, outputs=[debug_info])
 
             # Auto-refresh conversation
-            self.interface.load(
+            self.refresh_timer.tick(
                 fn=self.update_conversation,
+                inputs=[self.refresh_deadline],
                 outputs=[
                     self.conversation_display,
                     self.state_component,
                     debug_info,
+                    self.refresh_deadline,
+                    self.refresh_timer,
                 ],
-                every=1.0,  # Update every 1 second
             )
 
         return self.interface
 
-    def update_conversation(self) -> Tuple[List[Tuple[str, str]], dict, str]:
+    def start_fast_refresh(self) -> Tuple[float, gr.Timer]:
+        """Refresh quickly for a while so task updates show up promptly"""
+        deadline = time.monotonic() + self.ACTIVE_WINDOW
+        return deadline, gr.Timer(self.REFRESH_ACTIVE)
+
+    def _refresh_timer_update(self, deadline: float) -> Tuple[float, gr.Timer]:
+        """Drop back to the idle refresh rate once the active window expires"""
+        if deadline and time.monotonic() > deadline:
+            return 0.0, gr.Timer(self.REFRESH_IDLE)
+        return deadline, gr.update()
+
+    def update_conversation(
+        self, refresh_deadline: float
+    ) -> Tuple[List[Tuple[str, str]], dict, str, float, gr.Timer]:
         """Update conversation display from state"""
+        refresh_deadline, timer_update = self._refresh_timer_update(
+            refresh_deadline
+        )
         try:
-            state = self.state_manager.get_state()
+            state = self.state_manager.snapshot_view()
 
             # Debug info
             debug_text = f"📊 Entries: {len(state.transcript)} | Conversation ID: {state.conversation_id[:8]}..."
@@ -146,7 +182,7 @@ class GradioInterface:
                 else:
                     # For any other speaker, show as system message
                     conversation.append(
-                        (f"[{entry.speaker.value}] {entry.text}", None)
+                        (f"[{entry.speaker}] {entry.text}", None)
                     )
 
             state_dict = {
@@ -160,20 +196,34 @@ class GradioInterface:
             }
 
             # print(f"UI Update - Conversation items: {len(conversation)}")  # Debug print
-            return conversation, state_dict, debug_text
+            return (
+                conversation,
+                state_dict,
+                debug_text,
+                refresh_deadline,
+                timer_update,
+            )
 
         except Exception as e:
             error_msg = f"❌ Error updating: {str(e)}"
             print(error_msg)
-            return [], {"conversation": [], "status": "Error"}, error_msg
+            return (
+                [],
+                {"conversation": [], "status": "Error"},
+                error_msg,
+                refresh_deadline,
+                timer_update,
+            )
 
-    def handle_trigger(self, state_dict: dict) -> Tuple[str, str, dict]:
+    async def handle_trigger(
+        self, state_dict: dict
+    ) -> Tuple[str, str, dict]:
         """Handle Generate AI Assistance button"""
         print("\n=== Generate AI Assistance button clicked ===")
 
         if self.trigger_callback:
             try:
-                status, result = self.trigger_callback()
+                status, result = await self.trigger_callback()
                 return status, result, state_dict
             except Exception as e:
                 print(f"Error in trigger callback: {str(e)}")
@@ -1,11 +1,9 @@
 import asyncio
-import threading
-import time
 from components.speech_to_text import SpeechToTextService
-from components.llm_service import LLMService
+from components.llm_service import FALLBACK_DESCRIPTION, get_llm_service
 from components.orchestrator import Orchestrator
 from components.rag_service import RAGService
-from components.ai_agent import AIAgent
+from components.ai_agent import TASK_ERROR_PREFIX, AIAgent
 from components.state_manager import StateManager
 from frontend.gradio_app import GradioInterface
 from config import Config
@@ -16,7 +14,7 @@ class CustomerSupportAIApp:
         # Initialize components
         self.state_manager = StateManager()
         self.speech_service = SpeechToTextService()
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
         self.rag_service = RAGService()
         self.ai_agent = AIAgent()
         self.orchestrator = Orchestrator(
@@ -24,9 +22,10 @@ class CustomerSupportAIApp:
         )
         self.frontend = GradioInterface(self.state_manager)
         self.transcription_task = None
-        self.background_loop = None
-        self.background_thread = None
         self.is_running = False
+        self._last_processed_version = None
+        self._last_status = ""
+        self._last_result = ""
 
     async def initialize(self):
         """Initialize all services"""
@@ -57,7 +56,7 @@ class CustomerSupportAIApp:
                     print(
                         f"Adding transcript entry: {entry.speaker.value}: {entry.text}"
                     )
-                    self.state_manager.state.transcript.append(entry)
+                    self.state_manager.append_transcript_entry(entry)
                     print("Entry successfully added to state manager")
 
                     # Verify the entry was added
@@ -76,71 +75,53 @@ class CustomerSupportAIApp:
         # Start transcription with callback
         await self.speech_service.start_transcription_with_callback()
 
-    def run_background_loop(self):
-        """Run the background async loop in a separate thread"""
-        try:
-            self.background_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.background_loop)
-
-            # Initialize services
-            self.background_loop.run_until_complete(self.initialize())
-
-            # Start transcription loop
-            self.background_loop.run_until_complete(self._transcription_loop())
-
-        except Exception as e:
-            print(f"Error in background loop: {e}")
-        finally:
-            if self.background_loop:
-                self.background_loop.close()
-
-    def start_background_services(self):
-        """Start background services in a separate thread"""
-        self.is_running = True
-        self.background_thread = threading.Thread(
-            target=self.run_background_loop, daemon=True
-        )
-        self.background_thread.start()
-        print("Background services started")
-
-        # Give the background thread time to initialize
-        time.sleep(2)
-
-    def process_trigger_sync(self):
-        """Process trigger in sync context for Gradio"""
+    async def process_trigger(self):
+        """Process trigger for Gradio (awaited directly by the handler)"""
         print("\n=== Processing trigger ===")
-        transcript = self.state_manager.get_state().transcript
+        view = self.state_manager.snapshot_view()
+        version = view.version
+        transcript = view.transcript
         print(f"Current transcript length: {len(transcript)}")
 
         if not transcript:
             print("No transcript found")
             return "No conversation to process", ""
 
+        # Nothing new since the last successful run - reuse its result
+        if version == self._last_processed_version:
+            print("Transcript unchanged, returning previous result")
+            return self._last_status, self._last_result
+
         try:
-            # Create a new event loop for this operation
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            print("Generating task from transcript...")
+            task = await self.llm_service.generate_task_from_transcript(
+                transcript,
+                await self.state_manager.get_committed_prefix(
+                    self.llm_service.summarize_turns
+                ),
+            )
+            print(f"Generated task: {task.description}")
 
-            try:
-                print("Generating task from transcript...")
-                task = loop.run_until_complete(
-                    self.llm_service.generate_task_from_transcript(transcript)
-                )
-                print(f"Generated task: {task.description}")
+            rag_hint = self.rag_service.prefetch()
 
-                print("Routing task...")
-                result = loop.run_until_complete(
-                    self.orchestrator.route_task(task)
-                )
-                print(f"Task result: {result}")
+            print("Routing task...")
+            result = await self.orchestrator.route_task(task, rag_hint=rag_hint)
+            print(f"Task result: {result}")
 
-                return "Task completed successfully", result
+            # Only cache real results; a fallback task or failed browser run
+            # should be retried on the next trigger
+            if task.description == FALLBACK_DESCRIPTION or str(result).startswith(
+                TASK_ERROR_PREFIX
+            ):
+                return "Task could not be completed", result
 
-            finally:
-                loop.close()
+            self._last_processed_version = version
+            self._last_status = "Task completed successfully"
+            self._last_result = result
+            return self._last_status, self._last_result
 
         except Exception as e:
-            print(f"Error in process_trigger_sync: {str(e)}")
+            print(f"Error in process_trigger: {str(e)}")
             return f"Error: {str(e)}", ""
 
     def stop(self):
@@ -148,14 +129,20 @@ class CustomerSupportAIApp:
         self.is_running = False
         if self.speech_service:
             self.speech_service.stop_transcription()
-        if self.background_loop and not self.background_loop.is_closed():
-            self.background_loop.call_soon_threadsafe(self.background_loop.stop)
+        if self.transcription_task and not self.transcription_task.done():
+            self.transcription_task.cancel()
 
-    def run(self):
-        """Run the application"""
+    async def run(self):
+        """Run transcription on this asyncio loop and serve Gradio alongside it"""
         try:
-            # Start background services
-            self.start_background_services()
+            # Initialize services and start transcription on this loop;
+            # Gradio serves from its own uvicorn thread and event loop
+            await self.initialize()
+            self.is_running = True
+            self.transcription_task = asyncio.create_task(
+                self._transcription_loop()
+            )
+            print("Background services started")
 
             # Add a manual test entry to verify UI updates
             print("Adding manual test entry...")
@@ -169,8 +156,7 @@ class CustomerSupportAIApp:
             )
 
             # Add directly to state
-            with self.state_manager._lock:
-                self.state_manager.state.transcript.append(test_entry)
+            self.state_manager.append_transcript_entry(test_entry)
 
             print(
                 f"Manual entry added. Total entries: {len(self.state_manager.get_state().transcript)}"
@@ -178,14 +164,20 @@ class CustomerSupportAIApp:
 
             # Create and launch Gradio interface
             interface = self.frontend.create_interface(
-                trigger_callback=self.process_trigger_sync
+                trigger_callback=self.process_trigger
             )
 
             print("Launching Gradio interface...")
             interface.launch(
-                server_port=Config.GRADIO_PORT, share=False, inbrowser=True
+                server_port=Config.GRADIO_PORT,
+                share=False,
+                inbrowser=True,
+                prevent_thread_lock=True,
             )
 
+            # Keep the loop alive for the transcription task
+            await asyncio.Event().wait()
+
         except Exception as e:
             print(f"Error running application: {e}")
             self.stop()
@@ -197,7 +189,7 @@ def main():
     app = CustomerSupportAIApp()
 
     try:
-        app.run()
+        asyncio.run(app.run())
     except KeyboardInterrupt:
         print("\nShutting down...")
         app.stop()
@@ -2,7 +2,7 @@ import asyncio
 import uuid
 from datetime import datetime
 
-from components.llm_service import LLMService
+from components.llm_service import get_llm_service
 from utils.models import TranscriptEntry, Speaker, Task
 
 async def main():
@@ -17,7 +17,7 @@ async def main():
 ]
 
 
-    llm_service = LLMService()
+    llm_service = get_llm_service()
 
     print("Generating task from transcript...")
 
@@ -2,25 +2,45 @@
 Data models for the Customer Support AI Agent application.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import List, Optional, Tuple, Union
 from datetime import datetime
-from enum import Enum
-import uuid
+from enum import StrEnum
+import os
+import sys
 
 
-class Speaker(Enum):
+def generate_id() -> str:
+    """Random 128-bit hex id for tasks and conversations"""
+    return os.urandom(16).hex()
+
+
+# Shared default strings for Task fields
+DEFAULT_PLAN_STEP = sys.intern("Review customer request")
+DEFAULT_OPERATOR_INSTRUCTIONS = sys.intern(
+    "Review customer request and provide assistance"
+)
+DEFAULT_SUGGESTED_RESPONSE = sys.intern(
+    "Thank you for contacting us. How can I help you today?"
+)
+
+
+class Speaker(StrEnum):
     """Enum for different speakers in the conversation"""
 
     CUSTOMER = "customer"
     AGENT = "agent"
     SPEAKER = "speaker"  # Generic speaker when we can't differentiate
 
-    def __str__(self):
-        return self.value
 
+# Speaker lookup by raw label, including diarization labels from STT
+_SPEAKER_BY_VALUE = {s.value: s for s in Speaker}
+_SPEAKER_BY_VALUE.update(
+    {"Speaker A": Speaker.SPEAKER, "Speaker B": Speaker.SPEAKER}
+)
 
-class TaskStatus(Enum):
+
+class TaskStatus(StrEnum):
     """Enum for task statuses"""
 
     PENDING = "pending"
@@ -29,7 +49,7 @@ class TaskStatus(Enum):
     FAILED = "failed"
 
 
-class TaskType(Enum):
+class TaskType(StrEnum):
     """Enum for task types"""
 
     RAG = "rag"  # Information lookup/retrieval
@@ -46,21 +66,22 @@ class TranscriptEntry(BaseModel):
     class Config:
         """Pydantic configuration"""
 
-        use_enum_values = False  # Keep enum objects, don't convert to values
+        frozen = True  # Entries are append-only and shared between snapshots
 
-    def get_speaker_value(self) -> str:
-        """Get speaker value safely"""
-        return (
-            self.speaker.value
-            if hasattr(self.speaker, "value")
-            else str(self.speaker)
+    @classmethod
+    def unsafe_new(
+        cls, speaker: Speaker, text: str, timestamp: datetime
+    ) -> "TranscriptEntry":
+        """Build an entry from already-typed values, skipping validation"""
+        return cls.model_construct(
+            speaker=speaker, text=text, timestamp=timestamp
         )
 
 
 class Task(BaseModel):
     """Task generated from conversation analysis"""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=generate_id)
 
     # Basic task information
     customer_name: Optional[str] = "Customer"
@@ -70,9 +91,7 @@ class Task(BaseModel):
     description: str  # Main description (usually same as issue_description)
 
     # Task execution details
-    generated_plan: List[str] = Field(
-        default_factory=lambda: ["Review customer request"]
-    )
+    generated_plan: Tuple[str, ...] = (DEFAULT_PLAN_STEP,)
     task_type: str = "rag"  # "rag" or "agent"
     status: str = "pending"  # "pending", "processing", "completed", "failed"
     result: Optional[str] = None
@@ -86,20 +105,14 @@ class Task(BaseModel):
         "General Inquiry"  # e.g., "Order Status", "Refund Request", "Product Issue"
     )
     urgency_level: str = "Medium"  # "Low", "Medium", "High"
-    operator_instructions: str = (
-        "Review customer request and provide assistance"
-    )
-    verification_points: List[str] = Field(
-        default_factory=list
-    )  # Things operator should verify
-    suggested_response: str = (
-        "Thank you for contacting us. How can I help you today?"
-    )
+    operator_instructions: str = DEFAULT_OPERATOR_INSTRUCTIONS
+    verification_points: Tuple[str, ...] = ()  # Things operator should verify
+    suggested_response: str = DEFAULT_SUGGESTED_RESPONSE
 
     class Config:
         """Pydantic configuration"""
 
-        use_enum_values = True
+        validate_assignment = False  # Status updates are plain attribute sets
 
     def update_status(self, new_status: str, result: Optional[str] = None):
         """Update task status and result"""
@@ -112,20 +125,47 @@ class Task(BaseModel):
 class AppState(BaseModel):
     """Application state containing all conversation and task data"""
 
-    conversation_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    conversation_id: str = Field(default_factory=generate_id)
     transcript: List[TranscriptEntry] = Field(default_factory=list)
     current_task: Optional[Task] = None
     task_history: List[Task] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.now)
 
-    class Config:
-        """Pydantic configuration"""
+    # Formatted transcript lines, kept in lockstep with `transcript`
+    _transcript_lines: List[str] = PrivateAttr(default_factory=list)
+    _summary_cache: Optional[str] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        """Build the line cache for any entries passed at construction"""
+        self._transcript_lines = [
+            self._format_transcript_line(entry) for entry in self.transcript
+        ]
 
-        use_enum_values = True
+    @staticmethod
+    def _format_transcript_line(entry: TranscriptEntry) -> str:
+        """Format a single transcript entry as a plain text line"""
+        ts = entry.timestamp
+        return f"[{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}] {entry.speaker}: {entry.text}"
 
     def add_transcript_entry(self, entry: TranscriptEntry):
         """Add a new transcript entry"""
         self.transcript.append(entry)
+        self._transcript_lines.append(self._format_transcript_line(entry))
+        self._summary_cache = None
+
+    def evict_old(self, n: int) -> List[TranscriptEntry]:
+        """Remove and return the oldest n transcript entries"""
+        evicted = self.transcript[:n]
+        del self.transcript[:n]
+        del self._transcript_lines[:n]
+        self._summary_cache = None
+        return evicted
+
+    def clear_transcript(self):
+        """Remove all transcript entries"""
+        self.transcript.clear()
+        self._transcript_lines.clear()
+        self._summary_cache = None
 
     def set_current_task(self, task: Task):
         """Set the current active task"""
@@ -133,40 +173,53 @@ class AppState(BaseModel):
 
     def complete_current_task(self, result: str):
         """Complete the current task and move it to history"""
-        if self.current_task:
-            self.current_task.update_status("completed", result)
-            self.task_history.append(self.current_task)
-            self.current_task = None
+        task = self.current_task
+        if task is None:
+            return
+        task.status = "completed"
+        task.updated_at = datetime.now()
+        if result:
+            task.result = result
+        self.task_history.append(task)
+        self.current_task = None
 
     def get_transcript_text(self) -> str:
         """Get transcript as plain text"""
-        lines = []
-        for entry in self.transcript:
-            timestamp_str = entry.timestamp.strftime("%H:%M:%S")
-            lines.append(
-                f"[{timestamp_str}] {entry.speaker.value}: {entry.text}"
-            )
-        return "\n".join(lines)
+        return "\n".join(self._transcript_lines)
 
     def get_conversation_summary(self) -> str:
-        """Get a summary of the conversation"""
+        """Get a summary of the conversation (cached until the transcript changes)"""
+        if self._summary_cache is not None:
+            return self._summary_cache
+
         total_entries = len(self.transcript)
         if total_entries == 0:
-            return "No conversation yet"
+            summary = "No conversation yet"
+        else:
+            latest_entry = self.transcript[-1]
+            summary = f"{total_entries} messages, latest: {latest_entry.text[:50]}..."
 
-        latest_entry = self.transcript[-1]
-        return f"{total_entries} messages, latest: {latest_entry.text[:50]}..."
+        self._summary_cache = summary
+        return summary
 
 
 # Utility functions for working with models
 
 
 def create_transcript_entry(
-    speaker: str, text: str, timestamp: Optional[datetime] = None
+    speaker: Union[str, Speaker],
+    text: str,
+    timestamp: Optional[datetime] = None,
 ) -> TranscriptEntry:
     """Create a new transcript entry"""
+    # Pre-typed speakers come from trusted code paths; raw strings are validated
+    if isinstance(speaker, Speaker):
+        return TranscriptEntry.unsafe_new(
+            speaker, text, timestamp or datetime.now()
+        )
+    speaker_enum = _SPEAKER_BY_VALUE.get(speaker) or Speaker(speaker)
     return TranscriptEntry(
-        speaker=Speaker(speaker),
+        speaker=speaker_enum,
         text=text,
         timestamp=timestamp or datetime.now(),
     )
@@ -194,7 +247,7 @@ def create_task(
 
 def create_app_state(conversation_id: Optional[str] = None) -> AppState:
     """Create a new application state"""
-    return AppState(conversation_id=conversation_id or str(uuid.uuid4()))
+    return AppState(conversation_id=conversation_id or generate_id())
 
 
 # Constants for commonly used values
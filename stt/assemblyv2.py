@@ -6,8 +6,10 @@ Based on the working example but with speaker diarization enabled
 
 import assemblyai as aai
 from colorama import init, Fore, Style
-from datetime import datetime
+from itertools import groupby
 import os
+import sys
+import time
 
 # Initialize colorama for colored terminal output
 init(autoreset=True)
@@ -25,44 +27,58 @@ SPEAKER_COLORS = {
 }
 
 
-def get_speaker_color(speaker):
-    """Get color for speaker label"""
-    return SPEAKER_COLORS.get(speaker, Fore.WHITE)
+# Last formatted wall-clock second, reused by partials within the same second
+_last_second = None
+_last_timestamp = ""
+
+
+def get_timestamp():
+    """Get current local time as HH:MM:SS, formatted at most once per second"""
+    global _last_second, _last_timestamp
+    now = time.time()
+    second = int(now)
+    if second != _last_second:
+        _last_second = second
+        _last_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+    return _last_timestamp
+
+
+# Colored "Speaker X: " prefixes, built once per known speaker
+SPEAKER_PREFIXES = {
+    speaker: f"{color}Speaker {speaker}: {Fore.WHITE}"
+    for speaker, color in SPEAKER_COLORS.items()
+}
+
+
+def get_speaker_prefix(speaker):
+    """Get colored line prefix for speaker label"""
+    prefix = SPEAKER_PREFIXES.get(speaker)
+    if prefix is None:
+        prefix = f"{Fore.WHITE}Speaker {speaker}: {Fore.WHITE}"
+    return prefix
+
+
+def get_word_speaker(word):
+    """Get speaker label for a word, if diarization provided one"""
+    return getattr(word, "speaker", None)
 
 
 def display_transcript_with_speakers(transcript):
     """Display transcript with speaker diarization"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    timestamp = get_timestamp()
 
     # Check if we have word-level data with speakers
     if hasattr(transcript, "words") and transcript.words:
-        # Group consecutive words by speaker
-        current_speaker = None
-        current_text = []
-
-        for word in transcript.words:
-            speaker = getattr(word, "speaker", None)
-
-            if speaker != current_speaker:
-                # Display previous speaker's text if any
-                if current_text and current_speaker is not None:
-                    speaker_color = get_speaker_color(current_speaker)
-                    print(
-                        f"{Fore.BLUE}[{timestamp}] {speaker_color}Speaker {current_speaker}: {Fore.WHITE}{' '.join(current_text)}"
-                    )
-                    current_text = []
-
-                current_speaker = speaker
-
-            if hasattr(word, "text"):
-                current_text.append(word.text)
-
-        # Display remaining text
-        if current_text and current_speaker is not None:
-            speaker_color = get_speaker_color(current_speaker)
-            print(
-                f"{Fore.BLUE}[{timestamp}] {speaker_color}Speaker {current_speaker}: {Fore.WHITE}{' '.join(current_text)}"
-            )
+        # Group consecutive words by speaker and write all runs at once
+        line_start = f"{Fore.BLUE}[{timestamp}] "
+        lines = []
+        for speaker, words in groupby(transcript.words, key=get_word_speaker):
+            text = " ".join(w.text for w in words if hasattr(w, "text"))
+            if text and speaker is not None:
+                lines.append(line_start + get_speaker_prefix(speaker) + text)
+
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
     else:
         # Fallback to regular transcript without speaker info
         print(f"{Fore.BLUE}[{timestamp}] {Fore.WHITE}{transcript.text}")
@@ -85,7 +101,7 @@ def on_data(transcript: aai.RealtimeTranscript):
         display_transcript_with_speakers(transcript)
     else:
         # Partial transcript (live) - show without speaker info
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = get_timestamp()
         print(
             f"{Fore.BLUE}[{timestamp}] {Fore.YELLOW}[LIVE] {Fore.WHITE}{transcript.text}",
             end="\r",
@@ -1,22 +1,45 @@
 import asyncio
 import websockets
-import json
-import threading
-import queue
+import orjson
+import io
+import numpy as np
 import pyaudio
 import wave
-import tempfile
 import os
+import re
 from abc import ABC, abstractmethod
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+VAD_FRAME_MS = 20  # webrtcvad accepts 10, 20 or 30 ms frames
+VAD_HANGOVER_FRAMES = 25  # ~500 ms of non-speech ends an utterance
+MAX_BATCH_CHUNKS = 8
+MAX_BATCH_SECONDS = 30  # Whisper's encoder window
+BATCH_GAP_SECONDS = 0.3  # Silence between batched utterances
+STREAM_STEP_SECONDS = 1.0  # Re-transcribe the live buffer this often
+SENTENCE_END_PATTERN = re.compile(r"[.!?]$")
+
+# Streaming mode: an empty chunk on the audio queue marks VAD end of speech
+END_OF_SPEECH = np.zeros(0, dtype=np.float32)
+
+
+def wav_bytes_from_float32(audio: np.ndarray, sample_rate: int = 16000) -> bytes:
+    """Encode float32 samples as 16-bit mono WAV, for engines that need a file"""
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
 
 class STTProvider(Enum):
     WHISPER = "whisper"
@@ -34,9 +57,16 @@ class TranscriptionResult:
     timestamp: Optional[float] = None
 
 
+@dataclass
+class WordTiming:
+    word: str
+    start: float
+    end: float
+
+
 class STTEngine(ABC):
     @abstractmethod
-    async def transcribe(self, audio_data: bytes) -> TranscriptionResult:
+    async def transcribe(self, audio: np.ndarray) -> TranscriptionResult:
         pass
 
     @abstractmethod
@@ -45,38 +75,102 @@ class STTEngine(ABC):
 
 
 class WhisperEngine(STTEngine):
-    def __init__(self, model_size: str = "base"):
+    def __init__(
+        self, model_size: str = "base", compute_type: Optional[str] = None
+    ):
         try:
-            import whisper
+            from whisper_models import (
+                WHISPER_EXECUTOR,
+                WHISPER_SAMPLE_RATE,
+                get_whisper,
+                resample_to_whisper_rate,
+            )
 
-            self.model = whisper.load_model(model_size)
-            logger.info(f"Loaded Whisper model: {model_size}")
+            # Shared per process, so extra engines don't reload the weights
+            self.model = get_whisper(model_size, compute_type)
+            self._executor = WHISPER_EXECUTOR
+            self._sample_rate = WHISPER_SAMPLE_RATE
+            self._resample = resample_to_whisper_rate
         except ImportError:
-            raise ImportError("pip install openai-whisper")
+            raise ImportError("pip install faster-whisper")
 
-    async def transcribe(self, audio_data: bytes) -> TranscriptionResult:
-        # Save audio to temp file
-        with tempfile.NamedTemporaryFile(
-            suffix=".wav", delete=False
-        ) as temp_file:
-            temp_file.write(audio_data)
-            temp_path = temp_file.name
+    def _transcribe_sync(self, audio: np.ndarray) -> str:
+        """Run transcription and join segment texts (blocking)"""
+        segments, _info = self.model.transcribe(
+            audio, beam_size=1, vad_filter=True
+        )
+        return "".join(segment.text for segment in segments).strip()
 
-        try:
-            # Run transcription in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self.model.transcribe, temp_path
-            )
+    def _transcribe_words_sync(self, audio: np.ndarray) -> List[WordTiming]:
+        """Run transcription with word timestamps (blocking)"""
+        segments, _info = self.model.transcribe(
+            audio, beam_size=1, vad_filter=True, word_timestamps=True
+        )
+        return [
+            WordTiming(word.word, word.start, word.end)
+            for segment in segments
+            for word in segment.words or ()
+        ]
+
+    async def transcribe(
+        self, audio: np.ndarray, sr: int = 16000
+    ) -> TranscriptionResult:
+        # Other rates are resampled here, never by Whisper's ffmpeg loader
+        audio = self._resample(audio, sr)
+
+        # Run transcription on the dedicated Whisper thread to avoid blocking
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(
+            self._executor, self._transcribe_sync, audio
+        )
 
-            return TranscriptionResult(
-                text=result["text"].strip(), provider="whisper", is_final=True
+        return TranscriptionResult(text=text, provider="whisper", is_final=True)
+
+    async def transcribe_words(self, audio: np.ndarray) -> List[WordTiming]:
+        """Word-level timings, used by StreamingTranscriber"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._transcribe_words_sync, audio
+        )
+
+    async def transcribe_batch(
+        self, chunks: List[np.ndarray], sr: int = 16000
+    ) -> List[TranscriptionResult]:
+        """Transcribe several utterances in one pass; one result per utterance"""
+        if len(chunks) == 1:
+            return [await self.transcribe(chunks[0], sr)]
+
+        # Silence between utterances keeps words from running together at the
+        # joins; each word goes back to the utterance its midpoint falls in
+        gap = np.zeros(
+            int(BATCH_GAP_SECONDS * self._sample_rate), dtype=np.float32
+        )
+        parts, bounds, offset = [], [], 0
+        for chunk in chunks:
+            chunk = self._resample(chunk, sr)
+            parts.extend((chunk, gap))
+            offset += len(chunk) + len(gap)
+            bounds.append((offset - len(gap) / 2) / self._sample_rate)
+
+        words = await self.transcribe_words(np.concatenate(parts[:-1]))
+
+        texts: List[List[str]] = [[] for _ in chunks]
+        index = 0
+        for word in words:
+            midpoint = (word.start + word.end) / 2
+            while index < len(bounds) - 1 and midpoint > bounds[index]:
+                index += 1
+            texts[index].append(word.word)
+
+        return [
+            TranscriptionResult(
+                text="".join(text).strip(), provider="whisper", is_final=True
             )
-        finally:
-            os.unlink(temp_path)
+            for text in texts
+        ]
 
     def supports_streaming(self) -> bool:
-        return False
+        return True
 
 
 class OpenAIEngine(STTEngine):
@@ -88,24 +182,17 @@ class OpenAIEngine(STTEngine):
         except ImportError:
             raise ImportError("pip install openai")
 
-    async def transcribe(self, audio_data: bytes) -> TranscriptionResult:
-        with tempfile.NamedTemporaryFile(
-            suffix=".wav", delete=False
-        ) as temp_file:
-            temp_file.write(audio_data)
-            temp_path = temp_file.name
-
-        try:
-            with open(temp_path, "rb") as audio_file:
-                response = self.client.audio.transcriptions.create(
-                    model="whisper-1", file=audio_file, response_format="json"
-                )
+    async def transcribe(self, audio: np.ndarray) -> TranscriptionResult:
+        # Upload the in-memory WAV as a (filename, bytes) pair; no temp file
+        response = self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=("audio.wav", wav_bytes_from_float32(audio)),
+            response_format="json",
+        )
 
-            return TranscriptionResult(
-                text=response.text.strip(), provider="openai", is_final=True
-            )
-        finally:
-            os.unlink(temp_path)
+        return TranscriptionResult(
+            text=response.text.strip(), provider="openai", is_final=True
+        )
 
     def supports_streaming(self) -> bool:
         return False
@@ -121,17 +208,21 @@ class GoogleEngine(STTEngine):
         except ImportError:
             raise ImportError("pip install google-cloud-speech")
 
-    async def transcribe(self, audio_data: bytes) -> TranscriptionResult:
+    async def transcribe(self, audio: np.ndarray) -> TranscriptionResult:
         from google.cloud import speech
 
-        audio = speech.RecognitionAudio(content=audio_data)
+        recognition_audio = speech.RecognitionAudio(
+            content=wav_bytes_from_float32(audio)
+        )
         config = speech.RecognitionConfig(
             encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
             sample_rate_hertz=16000,
             language_code="en-US",
         )
 
-        response = self.client.recognize(config=config, audio=audio)
+        response = self.client.recognize(
+            config=config, audio=recognition_audio
+        )
 
         if response.results:
             result = response.results[0]
@@ -149,98 +240,256 @@ class GoogleEngine(STTEngine):
 
 
 class AudioRecorder:
-    def __init__(self, sample_rate: int = 16000, chunk_size: int = 1024):
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        chunk_size: int = 1024,
+        stream_step: Optional[float] = None,
+    ):
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
+        # When set, emit the live utterance every stream_step seconds
+        # instead of only once it ends
+        self.stream_step_bytes = (
+            int(stream_step * sample_rate) * 2 if stream_step else None
+        )
         self.format = pyaudio.paInt16
         self.channels = 1
         self.is_recording = False
-        self.audio_queue = queue.Queue()
+        # Filled from the PortAudio thread via call_soon_threadsafe
+        self.audio_queue: asyncio.Queue = asyncio.Queue()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # PortAudio init enumerates devices, so do it once and reuse the stream.
+        # Callback mode: PortAudio's own thread hands us each chunk, no read loop.
+        self._pa = pyaudio.PyAudio()
+        self._stream = self._pa.open(
+            format=self.format,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            frames_per_buffer=self.chunk_size,
+            start=False,
+            stream_callback=self._on_audio,
+        )
+        self.vad_frame_bytes = self.sample_rate * VAD_FRAME_MS // 1000 * 2
+        self._reset_utterance()
 
-    def start_recording(self):
-        """Start recording audio in background thread"""
-
-        def record_worker():
-            p = pyaudio.PyAudio()
-            stream = p.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size,
+        try:
+            import webrtcvad
+
+            self.vad = webrtcvad.Vad(2)
+        except ImportError:
+            logger.warning(
+                "webrtcvad not installed (pip install webrtcvad), "
+                "falling back to amplitude VAD"
             )
+            self.vad = None
+
+    def _reset_utterance(self):
+        """Clear the buffers for the utterance being built"""
+        self._frames = bytearray()
+        self._utterance_bytes = 0  # Includes audio already streamed out
+        self._pending = bytearray()  # Captured audio not yet split into VAD frames
+        self._silence_count = 0
+        self._speech_seen = False
+
+    def _flush_utterance(self):
+        """Queue the buffered utterance (or its unsent tail) for transcription"""
+        if self.stream_step_bytes is None:
+            self._enqueue(self._frames_to_array(self._frames))
+        else:
+            if self._frames:
+                self._enqueue(self._frames_to_array(self._frames))
+            self._enqueue(END_OF_SPEECH)
+        self._reset_utterance()
 
-            logger.info("Recording started")
-            frames = []
-            silence_count = 0
+    def _enqueue(self, audio: np.ndarray):
+        """Hand audio from the PortAudio thread to the event loop's queue"""
+        self._loop.call_soon_threadsafe(self.audio_queue.put_nowait, audio)
 
-            try:
-                while self.is_recording:
-                    data = stream.read(
-                        self.chunk_size, exception_on_overflow=False
-                    )
-                    frames.append(data)
-
-                    # Simple voice activity detection based on amplitude
-                    amplitude = max(data)
-                    if amplitude > 1000:  # Adjust threshold as needed
-                        silence_count = 0
-                    else:
-                        silence_count += 1
-
-                    # If we have 2 seconds of audio and recent silence, process it
-                    if (
-                        len(frames) > (self.sample_rate // self.chunk_size * 2)
-                        and silence_count > 20
-                    ):
-                        audio_data = self._frames_to_wav(frames)
-                        self.audio_queue.put(audio_data)
-                        frames = []
-                        silence_count = 0
-
-            except Exception as e:
-                logger.error(f"Recording error: {e}")
-            finally:
-                stream.stop_stream()
-                stream.close()
-                p.terminate()
-                logger.info("Recording stopped")
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback, runs on the audio thread"""
+        try:
+            self._process_chunk(in_data)
+        except Exception as e:
+            logger.error(f"Recording error: {e}")
+        return (None, pyaudio.paContinue)
+
+    def _process_chunk(self, data: bytes):
+        """Buffer a captured chunk and flush the utterance on trailing silence"""
+        chunk_bytes = self.chunk_size * 2  # int16 mono
+        self._frames.extend(data)
+        self._utterance_bytes += len(data)
+
+        if self.vad is not None:
+            self._pending.extend(data)
+            while len(self._pending) >= self.vad_frame_bytes:
+                frame = bytes(self._pending[: self.vad_frame_bytes])
+                del self._pending[: self.vad_frame_bytes]
+                if self.vad.is_speech(frame, self.sample_rate):
+                    self._speech_seen = True
+                    self._silence_count = 0
+                else:
+                    self._silence_count += 1
+
+            if not self._speech_seen:
+                # Keep a short pre-roll instead of buffering silence
+                del self._frames[: -2 * chunk_bytes]
+                return
+            if self._silence_count > VAD_HANGOVER_FRAMES:
+                self._flush_utterance()
+                return
+        else:
+            # Simple voice activity detection based on peak sample amplitude
+            samples = np.frombuffer(data, dtype=np.int16)
+            amplitude = int(np.abs(samples).max())
+            if amplitude > 500:  # Adjust threshold as needed
+                self._silence_count = 0
+            else:
+                self._silence_count += 1
+
+            # If we have 2 seconds of audio and recent silence, process it
+            if (
+                self._utterance_bytes
+                > (self.sample_rate // self.chunk_size * 2) * chunk_bytes
+                and self._silence_count > 20
+            ):
+                self._flush_utterance()
+                return
+
+        if (
+            self.stream_step_bytes is not None
+            and len(self._frames) >= self.stream_step_bytes
+        ):
+            # Streaming: hand over the new step; the consumer keeps the buffer
+            self._enqueue(self._frames_to_array(self._frames))
+            self._frames = bytearray()
 
+    def start_recording(self):
+        """Start the input stream; chunks arrive via _on_audio"""
+        # Must be called from the event loop that consumes audio_queue
+        self._loop = asyncio.get_running_loop()
+        self._reset_utterance()
         self.is_recording = True
-        self.record_thread = threading.Thread(target=record_worker)
-        self.record_thread.start()
+        self._stream.start_stream()
+        logger.info("Recording started")
 
     def stop_recording(self):
-        self.is_recording = False
-        if hasattr(self, "record_thread"):
-            self.record_thread.join()
-
-    def get_audio_chunk(self, timeout: float = 1.0) -> Optional[bytes]:
-        """Get next audio chunk from queue"""
+        if self.is_recording:
+            self.is_recording = False
+            self._stream.stop_stream()
+            logger.info("Recording stopped")
+
+    def close(self):
+        """Stop recording, close the input stream and release PortAudio"""
+        self.stop_recording()
+        self._stream.close()
+        self._pa.terminate()
+
+    async def get_audio_chunk(
+        self, timeout: float = 1.0
+    ) -> Optional[np.ndarray]:
+        """Wait for the next audio chunk; None on timeout"""
         try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
+            return await asyncio.wait_for(self.audio_queue.get(), timeout)
+        except asyncio.TimeoutError:
             return None
 
-    def _frames_to_wav(self, frames: list) -> bytes:
-        """Convert audio frames to WAV bytes"""
-        with tempfile.NamedTemporaryFile() as temp_file:
-            with wave.open(temp_file.name, "wb") as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(pyaudio.PyAudio().get_sample_size(self.format))
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(b"".join(frames))
-
-            temp_file.seek(0)
-            return temp_file.read()
+    def _frames_to_array(self, frames: bytearray) -> np.ndarray:
+        """Convert int16 audio frames to float32 samples in [-1, 1]"""
+        return np.frombuffer(frames, dtype=np.int16).astype(
+            np.float32
+        ) * (1 / 32768.0)
+
+
+class StreamingTranscriber:
+    """Commit-and-slice streaming over a rolling audio buffer
+
+    Every step the whole live buffer is re-transcribed with word timestamps.
+    Words that end before the newest step are treated as stable: they are
+    committed and their audio is sliced off the front of the buffer, so the
+    next pass only re-decodes the unstable tail and never cuts mid-word.
+    """
+
+    def __init__(
+        self,
+        engine: WhisperEngine,
+        sample_rate: int = 16000,
+        step: float = STREAM_STEP_SECONDS,
+        max_seconds: float = MAX_BATCH_SECONDS,
+    ):
+        self.engine = engine
+        self.sample_rate = sample_rate
+        self.step = step
+        self.max_samples = int(max_seconds * sample_rate)
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.committed: List[str] = []  # Stable words since the last final
+
+    async def feed(self, audio: np.ndarray) -> List[TranscriptionResult]:
+        """Add new audio; return a final result (on sentence end) and a partial"""
+        self.buffer = np.concatenate((self.buffer, audio))
+        if len(self.buffer) > self.max_samples:
+            # FIFO-truncate to Whisper's 30 s window
+            self.buffer = self.buffer[-self.max_samples :]
+
+        words = await self.engine.transcribe_words(self.buffer)
+        horizon = len(self.buffer) / self.sample_rate - self.step
+        stable = [w for w in words if w.end <= horizon]
+        tail = words[len(stable) :]
+
+        results = []
+        if stable:
+            self.committed.extend(w.word for w in stable)
+            self.buffer = self.buffer[int(stable[-1].end * self.sample_rate) :]
+
+            if SENTENCE_END_PATTERN.search(self.committed[-1].strip()):
+                results.append(self._final("".join(self.committed)))
+                self.committed = []
+
+        partial = "".join(self.committed + [w.word for w in tail]).strip()
+        if partial:
+            results.append(
+                TranscriptionResult(
+                    text=partial, provider="whisper", is_final=False
+                )
+            )
+        return results
+
+    async def flush(self) -> Optional[TranscriptionResult]:
+        """Finalize everything buffered; called when the VAD sees silence"""
+        words = []
+        if len(self.buffer):
+            words = await self.engine.transcribe_words(self.buffer)
+
+        text = "".join(self.committed + [w.word for w in words])
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.committed = []
+        return self._final(text) if text.strip() else None
+
+    def _final(self, text: str) -> TranscriptionResult:
+        return TranscriptionResult(
+            text=text.strip(), provider="whisper", is_final=True
+        )
 
 
 class SpeechToTextBackend:
-    def __init__(self, engine: STTEngine):
+    def __init__(self, engine: STTEngine, streaming: bool = False):
         self.engine = engine
-        self.recorder = AudioRecorder()
+        self.streamer = (
+            StreamingTranscriber(engine)
+            # Streaming needs word timings, which only local Whisper provides
+            if streaming and isinstance(engine, WhisperEngine)
+            else None
+        )
+        self.recorder = AudioRecorder(
+            stream_step=STREAM_STEP_SECONDS if self.streamer else None
+        )
         self.websocket_clients = set()
         self.is_running = False
+        self._carry: Optional[np.ndarray] = None  # Chunk that overflowed a batch
+        # Only local Whisper pays a fixed 30 s window per call; API engines
+        # bill per utterance and keep utterances separate
+        self._batching = isinstance(engine, WhisperEngine)
 
     async def add_websocket_client(self, websocket):
         """Add a websocket client for streaming"""
@@ -270,17 +519,83 @@ class SpeechToTextBackend:
             "timestamp": result.timestamp,
         }
 
-        # Send to all connected clients
-        disconnected_clients = set()
-        for client in self.websocket_clients:
-            try:
-                await client.send(json.dumps(message))
-            except websockets.exceptions.ConnectionClosed:
-                disconnected_clients.add(client)
+        # Serialize once, then send to all connected clients concurrently
+        payload = orjson.dumps(message).decode()  # Keep text frames for clients
+        clients = list(self.websocket_clients)
+        results = await asyncio.gather(
+            *(client.send(payload) for client in clients),
+            return_exceptions=True,
+        )
 
         # Remove disconnected clients
-        for client in disconnected_clients:
-            await self.remove_websocket_client(client)
+        for client, result in zip(clients, results):
+            if isinstance(result, websockets.exceptions.ConnectionClosed):
+                await self.remove_websocket_client(client)
+
+    async def _next_batch(self, timeout: float) -> Optional[List[np.ndarray]]:
+        """Collect chunks queued behind the next one that fit a 30 s window"""
+        if self._carry is not None:
+            first, self._carry = self._carry, None
+        else:
+            first = await self.recorder.get_audio_chunk(timeout=timeout)
+            if first is None:
+                return None
+
+        # The encoder pays for a full 30 s window regardless of input length,
+        # so a backlog is cheaper transcribed in one call than chunk by chunk
+        chunks = [first]
+        total = len(first)
+        gap = int(BATCH_GAP_SECONDS * self.recorder.sample_rate)
+        limit = MAX_BATCH_SECONDS * self.recorder.sample_rate
+        while len(chunks) < MAX_BATCH_CHUNKS:
+            try:
+                chunk = self.recorder.audio_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if total + gap + len(chunk) > limit:
+                self._carry = chunk
+                break
+            chunks.append(chunk)
+            total += gap + len(chunk)
+
+        return chunks
+
+    async def _next_stream_step(self, timeout: float) -> Optional[np.ndarray]:
+        """Merge steps queued behind the next one, stopping at END_OF_SPEECH"""
+        if self._carry is not None:
+            first, self._carry = self._carry, None
+        else:
+            first = await self.recorder.get_audio_chunk(timeout=timeout)
+        if first is None or len(first) == 0:
+            return first
+
+        # Each feed() re-decodes the whole buffer, so when inference falls
+        # behind catch up in one pass instead of one pass per stale step
+        chunks = [first]
+        while True:
+            try:
+                chunk = self.recorder.audio_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if len(chunk) == 0:
+                self._carry = chunk  # Flush after feeding what came before
+                break
+            chunks.append(chunk)
+
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+    async def _process_stream_chunk(self, audio: np.ndarray):
+        """Advance the streaming buffer and broadcast partial/final results"""
+        if len(audio) == 0:  # END_OF_SPEECH
+            results = [await self.streamer.flush()]
+        else:
+            results = await self.streamer.feed(audio)
+
+        for result in results:
+            if result is not None and result.text:
+                if result.is_final:
+                    logger.info(f"Transcribed: {result.text}")
+                await self.broadcast_transcription(result)
 
     async def start_processing(self):
         """Start the main processing loop"""
@@ -290,25 +605,37 @@ class SpeechToTextBackend:
         logger.info("Speech processing started")
 
         while self.is_running:
-            # Get audio chunk from recorder
-            audio_data = self.recorder.get_audio_chunk(timeout=0.5)
-
-            if audio_data:
+            # Wakes as soon as audio arrives; the timeout only re-checks
+            # is_running. Streaming and local Whisper catch up on any backlog
+            if self.streamer is not None:
+                audio = await self._next_stream_step(timeout=0.5)
+            elif self._batching:
+                audio = await self._next_batch(timeout=0.5)
+            else:
+                audio = await self.recorder.get_audio_chunk(timeout=0.5)
+
+            if audio is not None:
                 try:
-                    # Transcribe audio
-                    result = await self.engine.transcribe(audio_data)
-
-                    if (
-                        result.text.strip()
-                    ):  # Only send non-empty transcriptions
-                        logger.info(f"Transcribed: {result.text}")
-                        await self.broadcast_transcription(result)
+                    if self.streamer is not None:
+                        await self._process_stream_chunk(audio)
+                    else:
+                        # Transcribe audio; a batch (list of queued utterances)
+                        # yields one result per utterance, in queue order
+                        if self._batching:
+                            results = await self.engine.transcribe_batch(audio)
+                        else:
+                            results = [await self.engine.transcribe(audio)]
+
+                        for result in results:
+                            if (
+                                result.text.strip()
+                            ):  # Only send non-empty transcriptions
+                                logger.info(f"Transcribed: {result.text}")
+                                await self.broadcast_transcription(result)
 
                 except Exception as e:
                     logger.error(f"Transcription error: {e}")
 
-            await asyncio.sleep(0.1)  # Small delay to prevent busy waiting
-
     def stop_processing(self):
         """Stop processing"""
         self.is_running = False
@@ -322,9 +649,9 @@ async def websocket_handler(websocket, path, backend: SpeechToTextBackend):
     try:
         async for message in websocket:
             # Handle client messages if needed
-            data = json.loads(message)
+            data = orjson.loads(message)
             if data.get("type") == "ping":
-                await websocket.send(json.dumps({"type": "pong"}))
+                await websocket.send(orjson.dumps({"type": "pong"}).decode())
     except websockets.exceptions.ConnectionClosed:
         pass
     finally:
@@ -343,7 +670,12 @@ class STTServer:
         """Create appropriate STT engine based on provider"""
         if provider == STTProvider.WHISPER:
             model_size = kwargs.get("model_size", "base")
-            engine = WhisperEngine(model_size)
+            compute_type = kwargs.get("compute_type")
+            engine = WhisperEngine(model_size, compute_type)
+            # Local Whisper streams partial transcripts by default
+            return SpeechToTextBackend(
+                engine, streaming=kwargs.get("streaming", True)
+            )
         elif provider == STTProvider.OPENAI_API:
             api_key = kwargs.get("api_key")
             if not api_key:
@@ -374,6 +706,7 @@ class STTServer:
         finally:
             self.backend.stop_processing()
             await processing_task
+            self.backend.recorder.close()
 
 
 # Example usage and configuration
@@ -1,67 +1,74 @@
 #!/usr/bin/env python3
 """
 Voice-controlled browser automation system
-Uses OpenAI Whisper for local speech-to-text with extensible design for future API integration
+Uses faster-whisper (CTranslate2) for local speech-to-text with extensible design for future API integration
 """
 
 import asyncio
 import logging
-import threading
+import re
 from abc import ABC, abstractmethod
-from pathlib import Path
 from typing import Optional, Callable, Any
-import tempfile
-import wave
 
+import numpy as np
 import pyaudio
-import whisper
 from browser_use import Agent
 from langchain_openai import ChatOpenAI
 
+from whisper_models import WHISPER_EXECUTOR, get_whisper
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Voice commands that stop the controller, matched anywhere in the utterance
+EXIT_COMMAND_PATTERN = re.compile(r"exit|quit", re.IGNORECASE)
+
 
 class SpeechToTextBase(ABC):
     """Abstract base class for speech-to-text implementations"""
 
     @abstractmethod
-    async def transcribe(self, audio_file_path: str) -> str:
-        """Transcribe audio file to text"""
+    async def transcribe(self, audio: np.ndarray) -> str:
+        """Transcribe 16 kHz mono float32 audio to text"""
         pass
 
 
 class WhisperSTT(SpeechToTextBase):
-    """Local OpenAI Whisper implementation"""
+    """Local Whisper implementation on faster-whisper (CTranslate2)"""
 
-    def __init__(self, model_name: str = "base"):
+    def __init__(
+        self,
+        model_name: str = "distil-small.en",
+        compute_type: Optional[str] = None,
+    ):
         """
         Initialize Whisper model
 
         Args:
-            model_name: Whisper model size (tiny, base, small, medium, large)
+            model_name: Whisper model (distil-small.en, tiny, base, small, medium, large).
+                distil-small.en is English-only and a few points less accurate than
+                small, but several times faster, which suits short voice commands
+            compute_type: CTranslate2 weight type; defaults to int8 on CPU, int8_float16 on GPU
         """
-        logger.info(f"Loading Whisper model: {model_name}")
-        self.model = whisper.load_model(model_name)
-        logger.info("Whisper model loaded successfully")
+        self.model = get_whisper(model_name, compute_type)
 
-    async def transcribe(self, audio_file_path: str) -> str:
-        """Transcribe audio file using local Whisper model"""
+    def _transcribe_sync(self, audio: np.ndarray) -> str:
+        """Run transcription and join segment texts (blocking)"""
+        segments, _info = self.model.transcribe(
+            audio, beam_size=1, vad_filter=True
+        )
+        # segments is a lazy generator; decoding happens while iterating
+        return "".join(segment.text for segment in segments).strip()
+
+    async def transcribe(self, audio: np.ndarray) -> str:
+        """Transcribe audio samples using local Whisper model"""
         try:
-            # Run Whisper in thread pool to avoid blocking async loop
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, lambda: self.model.transcribe(audio_file_path)
+            # Run Whisper on its dedicated thread to avoid blocking async loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                WHISPER_EXECUTOR, self._transcribe_sync, audio
             )
-            # Whisper returns a dict with 'text' key containing a string
-            if (
-                isinstance(result, dict)
-                and "text" in result
-                and isinstance(result["text"], str)
-            ):
-                return result["text"].strip()
-            return ""
         except Exception as e:
             logger.error(f"Whisper transcription failed: {e}")
             return ""
@@ -74,7 +81,7 @@ class WhisperSTT(SpeechToTextBase):
 #         self.api_key = api_key
 #         self.service = service
 
-#     async def transcribe(self, audio_file_path: str) -> str:
+#     async def transcribe(self, audio: np.ndarray) -> str:
 #         """Future implementation for API-based transcription"""
 #         # TODO: Implement API calls to OpenAI Whisper API, Azure Speech, etc.
 #         raise NotImplementedError("API-based STT not yet implemented")
@@ -95,69 +102,58 @@ class VoiceRecorder:
         self.channels = channels
         self.format = format
         self.audio = pyaudio.PyAudio()
-        self.is_recording = False
-        self.frames = []
-
-    def start_recording(self):
-        """Start recording audio"""
-        self.is_recording = True
-        self.frames = []
-
+        # One input stream for the recorder's lifetime, started per command
         self.stream = self.audio.open(
             format=self.format,
             channels=self.channels,
             rate=self.sample_rate,
             input=True,
             frames_per_buffer=self.chunk_size,
+            start=False,
+            stream_callback=self._on_audio,
         )
+        self.is_recording = False
+        self.frames = bytearray()
 
-        logger.info("Started recording... Press Enter to stop")
+    def start_recording(self):
+        """Start recording audio"""
+        self.is_recording = True
+        self.frames = bytearray()
+        self.stream.start_stream()
 
-        # Record in separate thread
-        self.recording_thread = threading.Thread(target=self._record_audio)
-        self.recording_thread.start()
+        logger.info("Started recording... Press Enter to stop")
 
-    def stop_recording(self) -> str:
-        """Stop recording and save to temporary file"""
+    def stop_recording(self) -> np.ndarray:
+        """Stop recording and return float32 samples in [-1, 1]"""
         self.is_recording = False
+        self.stream.stop_stream()
 
-        if hasattr(self, "recording_thread"):
-            self.recording_thread.join()
-
-        if hasattr(self, "stream"):
-            self.stream.stop_stream()
-            self.stream.close()
+        # Whisper takes 16 kHz float32 directly, so skip the WAV round-trip
+        audio = np.frombuffer(self.frames, dtype=np.int16).astype(
+            np.float32
+        ) * (1 / 32768.0)
 
-        # Save to temporary WAV file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        temp_path = temp_file.name
-        temp_file.close()
+        logger.info(f"Recorded {len(audio) / self.sample_rate:.1f}s of audio")
+        return audio
 
-        with wave.open(temp_path, "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(self.audio.get_sample_size(self.format))
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(b"".join(self.frames))
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback, runs on the audio thread"""
+        if self.is_recording:
+            self.frames.extend(in_data)
+        return (None, pyaudio.paContinue)
 
-        logger.info(f"Audio saved to: {temp_path}")
-        return temp_path
-
-    def _record_audio(self):
-        """Internal method to record audio in separate thread"""
-        while self.is_recording:
-            try:
-                data = self.stream.read(
-                    self.chunk_size, exception_on_overflow=False
-                )
-                self.frames.append(data)
-            except Exception as e:
-                logger.error(f"Recording error: {e}")
-                break
+    def close(self):
+        """Close the input stream and release PortAudio"""
+        if getattr(self, "stream", None) is not None:
+            self.stream.close()
+            self.stream = None
+        if getattr(self, "audio", None) is not None:
+            self.audio.terminate()
+            self.audio = None
 
     def __del__(self):
         """Cleanup audio resources"""
-        if hasattr(self, "audio"):
-            self.audio.terminate()
+        self.close()
 
 
 class BrowserController:
@@ -239,35 +235,27 @@ class VoiceBrowserController:
         print("Recording... Press Enter to stop")
         input()  # Wait for user to stop recording
 
-        audio_file = self.recorder.stop_recording()
+        audio = self.recorder.stop_recording()
 
-        try:
-            # Transcribe audio
-            print("Transcribing...")
-            text = await self.stt.transcribe(audio_file)
-
-            if not text:
-                print("No speech detected or transcription failed")
-                return
+        # Transcribe audio
+        print("Transcribing...")
+        text = await self.stt.transcribe(audio)
 
-            print(f"You said: '{text}'")
+        if not text:
+            print("No speech detected or transcription failed")
+            return
 
-            # Check for exit command
-            if "exit" in text.lower() or "quit" in text.lower():
-                self.is_running = False
-                return
+        print(f"You said: '{text}'")
 
-            # Execute browser command
-            print("Executing command...")
-            result = await self.browser.execute_command(text)
-            print(f"Result: {result}")
+        # Check for exit command
+        if EXIT_COMMAND_PATTERN.search(text):
+            self.is_running = False
+            return
 
-        finally:
-            # Clean up temporary audio file
-            try:
-                Path(audio_file).unlink()
-            except Exception as e:
-                logger.warning(f"Failed to delete temp file {audio_file}: {e}")
+        # Execute browser command
+        print("Executing command...")
+        result = await self.browser.execute_command(text)
+        print(f"Result: {result}")
 
 
 async def main():
@@ -277,7 +265,7 @@ async def main():
         print("Initializing voice browser controller...")
 
         # Initialize STT (you can switch to APIBasedSTT later)
-        stt = WhisperSTT(model_name="base")  # or "small", "medium", "large"
+        stt = WhisperSTT(model_name="distil-small.en")  # or "base", "small", ...
 
         # Initialize browser controller
         browser = BrowserController()
@@ -0,0 +1,69 @@
+"""
+Shared faster-whisper models
+Loads each (model, compute type) pair once per process so every engine reuses the same weights
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+import ctranslate2
+import numpy as np
+from faster_whisper import WhisperModel
+
+logger = logging.getLogger(__name__)
+
+WHISPER_SAMPLE_RATE = 16000
+
+# Inference is compute-bound and CTranslate2 already parallelizes inside a
+# call, so run one call at a time on its own thread instead of competing with
+# the loop's default executor (and each other) for cores or the GPU
+WHISPER_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+
+
+def default_compute_type() -> str:
+    """INT8 weights on CPU; INT8 weights with float16 activations on GPU"""
+    if ctranslate2.get_cuda_device_count() > 0:
+        return "int8_float16"
+    return "int8"
+
+
+def get_whisper(
+    model_name: str, compute_type: Optional[str] = None
+) -> WhisperModel:
+    """Load (or reuse) a Whisper model; compute_type defaults per device"""
+    return _load_whisper(model_name, compute_type or default_compute_type())
+
+
+@lru_cache(maxsize=None)
+def _load_whisper(model_name: str, compute_type: str) -> WhisperModel:
+    """Load a Whisper model once per process and warm it up"""
+    logger.info(f"Loading Whisper model: {model_name} ({compute_type})")
+    model = WhisperModel(model_name, device="auto", compute_type=compute_type)
+    warmup(model)
+    logger.info("Whisper model loaded successfully")
+    return model
+
+
+def resample_to_whisper_rate(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Resample in-process with soxr so Whisper gets 16 kHz float32"""
+    if sample_rate == WHISPER_SAMPLE_RATE:
+        return audio
+    try:
+        import soxr
+    except ImportError:
+        raise ImportError("pip install soxr")
+    return soxr.resample(
+        audio, sample_rate, WHISPER_SAMPLE_RATE, quality="HQ"
+    ).astype(np.float32, copy=False)
+
+
+def warmup(model: WhisperModel, sample_rate: int = WHISPER_SAMPLE_RATE):
+    """Run a 1 s silent inference so the first real utterance skips setup cost"""
+    segments, _info = model.transcribe(
+        np.zeros(sample_rate, dtype=np.float32), beam_size=1
+    )
+    # segments is lazy; iterate so the encoder and decoder actually run
+    for _segment in segments:
+        pass
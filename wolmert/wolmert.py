@@ -1,169 +1,189 @@
+import asyncio
+import os
+
+# Skip Gradio's analytics/version-check HTTP calls at launch; must be set before import
+os.environ.setdefault("GRADIO_ANALYTICS_ENABLED", "False")
+
 import gradio as gr
+import html
+import itertools
+import jinja2
 import time
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+
+# Set SIMULATE_LATENCY=1 to add a 1 s fake processing delay to every request
+SIMULATE_LATENCY = bool(os.getenv("SIMULATE_LATENCY"))
 
 # Walmart-like color scheme
 walmart_blue = "#0071ce"
 walmart_yellow = "#ffc220"
 walmart_light_blue = "#e6f2ff"
 
-# Custom CSS for Walmart-like theme
-custom_css = """
-.gradio-container {
-    background-color: #f0f2f5;
-    font-family: 'Bogle', Arial, sans-serif;
-}
-.action-button {
-    background-color: #0071ce !important;
-    color: white !important;
-    border: none !important;
-    padding: 10px 20px !important;
-    border-radius: 4px !important;
-    font-weight: bold !important;
-    cursor: pointer !important;
-    transition: background-color 0.3s !important;
-}
-.action-button:hover {
-    background-color: #004c91 !important;
-}
-.header-title {
-    color: #0071ce;
-    font-size: 2.5em;
-    font-weight: bold;
-    text-align: center;
-    margin-bottom: 20px;
-}
-.status-box {
-    background-color: #e6f2ff;
-    padding: 15px;
-    border-radius: 8px;
-    margin: 10px 0;
-    border-left: 4px solid #0071ce;
-}
-.success-message {
-    background-color: #d4edda;
-    border-color: #c3e6cb;
-    color: #155724;
-    padding: 15px;
-    border-radius: 4px;
-    margin: 10px 0;
-}
-.error-message {
-    background-color: #f8d7da;
-    border-color: #f5c6cb;
-    color: #721c24;
-    padding: 15px;
-    border-radius: 4px;
-    margin: 10px 0;
-}
-.main-container {
-    max-width: 800px;
-    margin: 0 auto;
-    padding: 20px;
-}
-"""
+# Custom CSS for Walmart-like theme, served as a static file so browsers cache it
+STATIC_DIR = Path(__file__).parent / "static"
+CSS_PATH = STATIC_DIR / "walmart.css"
+# Relative to the working directory (Gradio resolves file= paths from there) and
+# linked without a leading slash, so it also works when the app is mounted
+CSS_HREF = "file=" + Path(os.path.relpath(CSS_PATH)).as_posix()
+# Registered at import so the stylesheet is served however the app is launched
+gr.set_static_paths(paths=[STATIC_DIR])
+
+class SkipStreamGZipMiddleware(GZipMiddleware):
+    """GZip responses, except Gradio's SSE queue stream (buffering would delay events)"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith("/queue/data"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
-# Simulated database for orders
-orders_db = {
-    "12345": {"customer": "John Doe", "amount": 149.99, "items": ["TV Stand", "HDMI Cable"]},
-    "67890": {"customer": "Jane Smith", "amount": 89.50, "items": ["Bluetooth Speaker"]},
-    "11111": {"customer": "Bob Johnson", "amount": 234.00, "items": ["Gaming Console", "Extra Controller"]}
+@dataclass(slots=True, frozen=True)
+class Order:
+    customer: str
+    amount: float
+    items: tuple
+    items_str: str  # Precomputed ", ".join(items) for the cancel message
+
+# Simulated database for orders (read-only; cancellations are tracked separately)
+_orders_raw = {
+    "12345": Order("John Doe", 149.99, ("TV Stand", "HDMI Cable"), "TV Stand, HDMI Cable"),
+    "67890": Order("Jane Smith", 89.50, ("Bluetooth Speaker",), "Bluetooth Speaker"),
+    "11111": Order("Bob Johnson", 234.00, ("Gaming Console", "Extra Controller"), "Gaming Console, Extra Controller")
 }
+orders_db = MappingProxyType(_orders_raw)  # Read-only view; nothing mutates the table
+cancelled_orders = set()  # set.add is atomic, so concurrent cancels can't race
 
-def process_refund(order_id, refund_amount, customer_name):
-    """Process refund request"""
-    # Simulate processing time
-    time.sleep(1)
-    
-    if order_id in orders_db:
-        order = orders_db[order_id]
-        if float(refund_amount) <= order["amount"]:
-            success_msg = f"""<div class='success-message'>
+def get_order(order_id):
+    """Return the live order, or None if it doesn't exist or was cancelled"""
+    if order_id in cancelled_orders:
+        return None
+    return orders_db.get(order_id)
+
+# Monotonic transaction IDs, seeded from the start time so restarts don't reuse them
+_tx_counter = itertools.count(int(time.time()) * 1000)
+
+# Money formatter bound once; handlers pass pre-formatted amounts to the templates
+_fmt_money = "${:.2f}".format
+
+# Result templates, compiled once at import; handlers only render them
+template_env = jinja2.Environment(autoescape=True)
+
+REFUND_OK_TPL = template_env.from_string("""<div class='success-message'>
             <h3>✅ REFUND PROCESSED</h3>
-            <p>Refund of <strong>${refund_amount}</strong> has been sent to <strong>{customer_name}</strong></p>
-            <p>Transaction ID: REF-{int(time.time())}</p>
+            <p>Refund of <strong>{{ amount }}</strong> has been sent to <strong>{{ customer }}</strong></p>
+            <p>Transaction ID: REF-{{ tx }}</p>
             <p>You will receive a confirmation email shortly.</p>
-            </div>"""
-            return success_msg
-        else:
-            error_msg = f"""<div class='error-message'>
+            </div>""")
+
+REFUND_FAIL_TPL = template_env.from_string("""<div class='error-message'>
             <h3>❌ REFUND FAILED</h3>
-            <p>Refund amount exceeds order total (${order['amount']})</p>
+            <p>Refund amount exceeds order total ({{ order_total }})</p>
             <p>Please enter an amount less than or equal to the order total.</p>
-            </div>"""
-            return error_msg
-    else:
-        error_msg = f"""<div class='error-message'>
-        <h3>❌ ORDER NOT FOUND</h3>
-        <p>No order found with ID: {order_id}</p>
-        <p>Please check the order ID and try again.</p>
-        </div>"""
-        return error_msg
+            </div>""")
 
-def process_price_match(order_id, competitor_price, competitor_name):
-    """Process price match request"""
-    # Simulate processing time
-    time.sleep(1)
-    
-    if order_id in orders_db:
-        order = orders_db[order_id]
-        current_price = order["amount"]
-        comp_price = float(competitor_price)
-        
-        if comp_price < current_price:
-            difference = current_price - comp_price
-            success_msg = f"""<div class='success-message'>
+PRICE_MATCH_OK_TPL = template_env.from_string("""<div class='success-message'>
             <h3>✅ PRICE MATCH APPROVED</h3>
-            <p>Original Price: <strong>${current_price}</strong></p>
-            <p>Competitor ({competitor_name}) Price: <strong>${comp_price}</strong></p>
-            <p>Refund Amount: <strong>${difference:.2f}</strong></p>
+            <p>Original Price: <strong>{{ current_price }}</strong></p>
+            <p>Competitor ({{ competitor }}) Price: <strong>{{ comp_price }}</strong></p>
+            <p>Refund Amount: <strong>{{ difference }}</strong></p>
             <p>The price difference has been credited to your account.</p>
-            </div>"""
-            return success_msg
-        else:
-            error_msg = f"""<div class='error-message'>
+            </div>""")
+
+PRICE_MATCH_FAIL_TPL = template_env.from_string("""<div class='error-message'>
             <h3>❌ PRICE MATCH DENIED</h3>
-            <p>Competitor price (${comp_price}) is not lower than current price (${current_price})</p>
+            <p>Competitor price ({{ comp_price }}) is not lower than current price ({{ current_price }})</p>
             <p>We only match prices that are lower than our current price.</p>
-            </div>"""
-            return error_msg
-    else:
-        error_msg = f"""<div class='error-message'>
-        <h3>❌ ORDER NOT FOUND</h3>
-        <p>No order found with ID: {order_id}</p>
-        <p>Please check the order ID and try again.</p>
-        </div>"""
-        return error_msg
+            </div>""")
 
-def process_cancel_order(order_id):
-    """Process order cancellation"""
-    # Simulate processing time
-    time.sleep(1)
-    
-    if order_id in orders_db:
-        order = orders_db[order_id]
-        items_list = ", ".join(order['items'])
-        success_msg = f"""<div class='success-message'>
+CANCEL_OK_TPL = template_env.from_string("""<div class='success-message'>
         <h3>✅ ORDER CANCELLED</h3>
-        <p>Order <strong>{order_id}</strong> has been cancelled</p>
-        <p>Customer: <strong>{order['customer']}</strong></p>
-        <p>Items: {items_list}</p>
-        <p>Refund Amount: <strong>${order['amount']}</strong></p>
+        <p>Order <strong>{{ order_id }}</strong> has been cancelled</p>
+        <p>Customer: <strong>{{ customer }}</strong></p>
+        <p>Items: {{ items }}</p>
+        <p>Refund Amount: <strong>{{ amount }}</strong></p>
         <p>Refund will be processed within 3-5 business days.</p>
-        </div>"""
-        # Remove order from database
-        del orders_db[order_id]
-        return success_msg
-    else:
-        error_msg = f"""<div class='error-message'>
+        </div>""")
+
+# Not-found only varies by order ID, so it's plain constant prefix + ID + suffix
+_NF_PRE = """<div class='error-message'>
         <h3>❌ ORDER NOT FOUND</h3>
-        <p>No order found with ID: {order_id}</p>
+        <p>No order found with ID: """
+_NF_POST = """</p>
         <p>Please check the order ID and try again.</p>
         </div>"""
-        return error_msg
+
+@lru_cache(maxsize=256)
+def _not_found_html(order_id):
+    """Not-found message, cached since retries repeat the same bad ID"""
+    return _NF_PRE + html.escape(order_id) + _NF_POST
+
+def require_order(fn):
+    """Simulate latency, look the order up once, and short-circuit unknown/cancelled IDs"""
+    async def wrapper(order_id, *args):
+        # Simulate processing time
+        if SIMULATE_LATENCY:
+            await asyncio.sleep(1)
+
+        order = get_order(order_id)
+        if order is None:
+            return _not_found_html(order_id)
+        return await fn(order_id, order, *args)
+
+    # Not functools.wraps: Gradio would read the wrapped signature and expect an input for `order`
+    wrapper.__name__ = fn.__name__
+    wrapper.__doc__ = fn.__doc__
+    return wrapper
+
+@require_order
+async def process_refund(order_id, order, refund_amount: float, customer_name):
+    """Process refund request"""
+    # gr.Number already delivers a float
+    if refund_amount <= order.amount:
+        return REFUND_OK_TPL.render(amount=_fmt_money(refund_amount), customer=customer_name, tx=next(_tx_counter))
+    else:
+        return REFUND_FAIL_TPL.render(order_total=_fmt_money(order.amount))
+
+@require_order
+async def process_price_match(order_id, order, competitor_price: float, competitor_name):
+    """Process price match request"""
+    current_price = order.amount
+    comp_price = competitor_price
+    
+    if comp_price < current_price:
+        difference = current_price - comp_price
+        return PRICE_MATCH_OK_TPL.render(
+            current_price=_fmt_money(current_price),
+            competitor=competitor_name,
+            comp_price=_fmt_money(comp_price),
+            difference=_fmt_money(difference)
+        )
+    else:
+        return PRICE_MATCH_FAIL_TPL.render(comp_price=_fmt_money(comp_price), current_price=_fmt_money(current_price))
+
+@require_order
+async def process_cancel_order(order_id, order):
+    """Process order cancellation"""
+    success_msg = CANCEL_OK_TPL.render(
+        order_id=order_id,
+        customer=order.customer,
+        items=order.items_str,
+        amount=_fmt_money(order.amount)
+    )
+    # Mark the order cancelled; the order table itself stays immutable
+    cancelled_orders.add(order_id)
+    return success_msg
 
 # Create Gradio interface
-with gr.Blocks(css=custom_css, theme=gr.themes.Base()) as demo:
+with gr.Blocks(
+    head=f'<link rel="stylesheet" href="{CSS_HREF}">',
+    theme=gr.themes.Base()
+) as demo:
     gr.HTML('<div class="header-title">🛒 M<span style="color: #ffc220;">A</span>LWART Customer Service Portal</div>')
     
     with gr.Row():
@@ -230,25 +250,36 @@ with gr.Blocks(css=custom_css, theme=gr.themes.Base()) as demo:
                     label="Result"
                 )
     
-    # Connect buttons to handlers
+    # Connect buttons to handlers (UI-only: no public API endpoint, no progress overlay)
     cancel_btn.click(
         process_cancel_order,
         inputs=[order_id_cancel],
-        outputs=[cancel_output]
+        outputs=[cancel_output],
+        api_name=False,
+        show_progress="hidden"
     )
     
     price_match_btn.click(
         process_price_match,
         inputs=[order_id_price, competitor_price, competitor_name],
-        outputs=[price_match_output]
+        outputs=[price_match_output],
+        api_name=False,
+        show_progress="hidden"
     )
     
     refund_btn.click(
         process_refund,
         inputs=[order_id_refund, refund_amount, customer_name],
-        outputs=[refund_output]
+        outputs=[refund_output],
+        api_name=False,
+        show_progress="hidden"
     )
 
 # Launch the app
 if __name__ == "__main__":
-    demo.launch(server_name="localhost", server_port=7866, share=True)
\ No newline at end of file
+    # Handlers are async and sleep-bound, so many can run at once; bound the backlog
+    demo.queue(default_concurrency_limit=16, max_size=128, status_update_rate="auto")
+    # Public share tunnel only on request (GRADIO_SHARE=1); it adds WAN latency to every call
+    demo.launch(server_name="localhost", server_port=7866, share=os.getenv("GRADIO_SHARE", "0") == "1",
+                quiet=True, show_api=False,
+                app_kwargs={"middleware": [Middleware(SkipStreamGZipMiddleware, minimum_size=500)]})
\ No newline at end of file